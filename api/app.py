@@ -261,4 +261,13 @@ async def info_endpoint(file: UploadFile = File(...)):
 if __name__ == "__main__":
     import uvicorn
     port = int(os.getenv("PORT", 8000))
-    uvicorn.run(app, host="0.0.0.0", port=port)
+    workers = int(os.getenv("WORKERS", 1))
+    if workers > 1:
+        # Multi-worker mode needs an import string, which only resolves with
+        # api/ on sys.path (python api/app.py, or run from inside api/).
+        # Each worker re-runs this module's top level as both __mp_main__
+        # and app, repeating the PCC path setup and imports; for production
+        # prefer the uvicorn CLI with --workers / WEB_CONCURRENCY.
+        uvicorn.run("app:app", host="0.0.0.0", port=port, workers=workers)
+    else:
+        uvicorn.run(app, host="0.0.0.0", port=port)